@@ -1,29 +1,115 @@
+import functools
 import math
+import numpy as np
 import sympy as sp
 import pandas as pd
 import sys
 
 # --- Core Numerical Methods ---
 
+@functools.lru_cache(maxsize=256)
+def _parse(func_str):
+    """Parses a function string with sympy, once per unique string."""
+    return sp.sympify(func_str)
+
+# Horner form needs the dense coefficient list, so it's limited to modest degrees
+MAX_HORNER_DEGREE = 50
+
+def _numeric_form(expr, x):
+    """Prepares an expression for lambdify.
+
+    Constant subexpressions (pi, sqrt(2), ...) are folded to floats up front and
+    dense polynomials are rewritten in Horner form, so evaluation is a chain of
+    multiply-adds on plain floats. Sparse ones like x**20000 - 1 are left as is.
+    """
+    expr = expr.replace(lambda e: e.is_number and not e.is_Number, lambda e: e.evalf(17))
+    if expr.is_polynomial(x) and x in expr.free_symbols:
+        poly = sp.Poly(expr, x)
+        if len(poly.terms()) > 2 and poly.degree() <= MAX_HORNER_DEGREE:
+            return sp.horner(expr, x)
+    return expr
+
+@functools.lru_cache(maxsize=128)
+def _compile(func_str):
+    """Returns a fast numeric callable of x for a function string."""
+    try:
+        x = sp.symbols('x')
+        expr = _parse(func_str)
+        if x not in expr.free_symbols:
+            # Constant expression: no need to lambdify, just return its value
+            value = float(expr)
+            return lambda x_val: value
+        return sp.lambdify(x, _numeric_form(expr, x), modules='math')
+    except Exception as e:
+        raise ValueError(f"Error evaluating function: {e}")
+
 def evaluate_function(func_str, x_val):
     """Evaluates a mathematical function string at a given x."""
+    return _evaluate_cached(func_str, float(x_val))
+
+@functools.lru_cache(maxsize=4096)
+def _evaluate_cached(func_str, x_val):
+    """Memoized evaluation so repeated points (e.g. carried-over iterates) are a lookup."""
+    try:
+        return float(_compile(func_str)(x_val))
+    except Exception:
+        pass
+    # Cold path for what the math-module callable can't handle (e.g. functions
+    # the math module lacks, or that can't be printed at all): let sympy
+    # evaluate it numerically
     try:
         x = sp.symbols('x')
-        # Use sympy to parse and evaluate for better safety and power
-        expr = sp.sympify(func_str)
-        return float(expr.subs(x, x_val))
+        return float(_parse(func_str).evalf(15, subs={x: x_val}, strict=False))
     except Exception as e:
         raise ValueError(f"Error evaluating function: {e}")
 
+@functools.lru_cache(maxsize=128)
 def get_derivative(func_str):
     """Calculates the derivative of the function string."""
     x = sp.symbols('x')
-    expr = sp.sympify(func_str)
-    diff_expr = sp.diff(expr, x)
+    diff_expr = sp.diff(_parse(func_str), x)
     return str(diff_expr)
 
-def bisection_method(func_str, a, b, tol, max_iter):
-    results = []
+@functools.lru_cache(maxsize=128)
+def _compile_with_derivative(func_str):
+    """Returns one callable computing (f(x), f'(x)), with shared subexpressions evaluated once.
+
+    Returns None if the pair can't be lambdified (e.g. an unprintable derivative),
+    in which case callers evaluate f and f' separately.
+    """
+    try:
+        x = sp.symbols('x')
+        expr = _parse(func_str)
+        diff_expr = sp.diff(expr, x)
+    except Exception as e:
+        raise ValueError(f"Error evaluating function: {e}")
+    try:
+        return sp.lambdify(x, (_numeric_form(expr, x), _numeric_form(diff_expr, x)), modules='math', cse=True)
+    except Exception:
+        return None
+
+def evaluate_with_derivative(func_str, x_val):
+    """Evaluates f and f' at a given x in a single call."""
+    fdf = _compile_with_derivative(func_str)
+    if fdf is not None:
+        try:
+            f0, df0 = fdf(x_val)
+            return float(f0), float(df0)
+        except Exception:
+            pass
+    return evaluate_function(func_str, x_val), evaluate_function(get_derivative(func_str), x_val)
+
+def _new_table(*columns):
+    """Creates an empty iteration table stored column-wise (dict of lists)."""
+    return {name: [] for name in columns}
+
+def _add_row(table, *values):
+    """Appends one iteration to a column-wise table, values in column order."""
+    for column, value in zip(table.values(), values):
+        column.append(value)
+
+def bisection_method(func_str, a, b, tol, max_iter, record=True):
+    results = _new_table("Iteration", "a", "b", "c (Root Est)", "f(c)", "Error") if record else None
     
     fa = evaluate_function(func_str, a)
     fb = evaluate_function(func_str, b)
@@ -33,19 +119,20 @@ def bisection_method(func_str, a, b, tol, max_iter):
 
     for i in range(1, max_iter + 1):
         c = (a + b) / 2
+        error = math.fabs(b - a) # Or abs(c - old_c) if we tracked it, but interval width is standard for bisection
+        
+        # The interval test is cheaper, and once it passes f(c) isn't needed
+        if error < tol:
+            if record:
+                _add_row(results, i, a, b, c, None, error)
+            break
+        
         fc = evaluate_function(func_str, c)
-        error = abs(b - a) # Or abs(c - old_c) if we tracked it, but interval width is standard for bisection
-        
-        results.append({
-            "Iteration": i,
-            "a": a,
-            "b": b,
-            "c (Root Est)": c,
-            "f(c)": fc,
-            "Error": error
-        })
-        
-        if abs(fc) < tol or error < tol:
+        
+        if record:
+            _add_row(results, i, a, b, c, fc, error)
+        
+        if math.fabs(fc) < tol:
             break
         
         if fa * fc < 0:
@@ -57,8 +144,8 @@ def bisection_method(func_str, a, b, tol, max_iter):
             
     return {"results": results, "root": c, "final_error": error, "iterations": i}
 
-def regula_falsi_method(func_str, a, b, tol, max_iter):
-    results = []
+def regula_falsi_method(func_str, a, b, tol, max_iter, record=True):
+    results = _new_table("Iteration", "a", "b", "c (Root Est)", "f(c)", "Error") if record else None
     
     fa = evaluate_function(func_str, a)
     fb = evaluate_function(func_str, b)
@@ -69,23 +156,18 @@ def regula_falsi_method(func_str, a, b, tol, max_iter):
     c = a # Initialize c
     for i in range(1, max_iter + 1):
         # c = b - (f(b) * (a - b)) / (f(a) - f(b))
-        if abs(fa - fb) < 1e-12: # Avoid division by zero
+        denom = fb - fa
+        if denom == 0.0: # Avoid division by zero
              return {"error": "Division by zero in Regula Falsi."}
              
-        c = (a * fb - b * fa) / (fb - fa)
+        c = (a * fb - b * fa) / denom
         fc = evaluate_function(func_str, c)
-        error = abs(fc) # For RF, error is often estimated by |f(c)| or |c_new - c_old|
-        
-        results.append({
-            "Iteration": i,
-            "a": a,
-            "b": b,
-            "c (Root Est)": c,
-            "f(c)": fc,
-            "Error": error
-        })
-        
-        if abs(fc) < tol:
+        error = math.fabs(fc) # For RF, error is often estimated by |f(c)| or |c_new - c_old|
+        
+        if record:
+            _add_row(results, i, a, b, c, fc, error)
+        
+        if error < tol:
             break
         
         if fa * fc < 0:
@@ -97,85 +179,104 @@ def regula_falsi_method(func_str, a, b, tol, max_iter):
             
     return {"results": results, "root": c, "final_error": error, "iterations": i}
 
-def secant_method(func_str, x0, x1, tol, max_iter):
-    results = []
+def secant_method(func_str, x0, x1, tol, max_iter, record=True, conservative=True):
+    results = _new_table("Iteration", "x(i-1)", "x(i)", "x(i+1) (Root Est)", "f(x2)", "Error") if record else None
+    # Secant converges with order phi ~ 1.618, so with conservative=False we stop
+    # once error**phi < tol: the next step would already be within tol. That
+    # estimate, rather than the last step size, is then reported as final_error.
+    order = 1 if conservative else (1 + math.sqrt(5)) / 2
+    stop = max(tol, tol ** (1 / order))
+    
+    f0 = evaluate_function(func_str, x0)
+    f1 = evaluate_function(func_str, x1)
     
     for i in range(1, max_iter + 1):
-        f0 = evaluate_function(func_str, x0)
-        f1 = evaluate_function(func_str, x1)
-        
-        if abs(f1 - f0) < 1e-12:
+        denom = f1 - f0
+        if denom == 0.0:
             return {"error": "Division by zero in Secant Method."}
             
-        x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
-        error = abs(x2 - x1)
-        
-        results.append({
-            "Iteration": i,
-            "x(i-1)": x0,
-            "x(i)": x1,
-            "x(i+1) (Root Est)": x2,
-            "f(x2)": evaluate_function(func_str, x2),
-            "Error": error
-        })
+        x2 = x1 - f1 * (x1 - x0) / denom
+        f2 = evaluate_function(func_str, x2)
+        error = math.fabs(x2 - x1)
         
-        if error < tol:
-            return {"results": results, "root": x2, "final_error": error, "iterations": i}
+        if record:
+            _add_row(results, i, x0, x1, x2, f2, error)
+        
+        if error < stop:
+            return {"results": results, "root": x2, "final_error": error ** order, "iterations": i}
             
-        x0 = x1
-        x1 = x2
+        # Carry the already-computed values forward instead of re-evaluating
+        x0, f0 = x1, f1
+        x1, f1 = x2, f2
         
     return {"results": results, "root": x2, "final_error": error, "iterations": max_iter}
 
-def newton_raphson_method(func_str, x0, tol, max_iter):
-    results = []
-    deriv_str = get_derivative(func_str)
+def newton_raphson_method(func_str, x0, tol, max_iter, record=True, conservative=True):
+    results = _new_table("Iteration", "x(i)", "f(x)", "f'(x)", "x(i+1) (Root Est)", "Error") if record else None
+    # Newton converges quadratically, so with conservative=False we stop once
+    # error < sqrt(tol): the next step would already be within tol. That
+    # estimate (error**2), rather than the last step size, is then reported as
+    # final_error.
+    order = 1 if conservative else 2
+    stop = max(tol, tol ** (1 / order))
     
     for i in range(1, max_iter + 1):
-        f0 = evaluate_function(func_str, x0)
-        df0 = evaluate_function(deriv_str, x0)
+        f0, df0 = evaluate_with_derivative(func_str, x0)
         
-        if abs(df0) < 1e-12:
+        if math.fabs(df0) < 1e-12:
             return {"error": "Derivative is zero. Newton-Raphson fails."}
             
         x1 = x0 - f0 / df0
-        error = abs(x1 - x0)
+        error = math.fabs(x1 - x0)
         
-        results.append({
-            "Iteration": i,
-            "x(i)": x0,
-            "f(x)": f0,
-            "f'(x)": df0,
-            "x(i+1) (Root Est)": x1,
-            "Error": error
-        })
+        if record:
+            _add_row(results, i, x0, f0, df0, x1, error)
         
-        if error < tol:
-            return {"results": results, "root": x1, "final_error": error, "iterations": i}
+        if error < stop:
+            return {"results": results, "root": x1, "final_error": error ** order, "iterations": i}
             
         x0 = x1
         
     return {"results": results, "root": x1, "final_error": error, "iterations": max_iter}
 
-def fixed_point_iteration(func_str, x0, tol, max_iter):
+def fixed_point_iteration(func_str, x0, tol, max_iter, use_aitken=False, record=True):
     # Note: User must provide g(x) such that x = g(x)
     # Or we assume func_str is f(x) and we try x + f(x)? 
     # Standard requirement usually implies user gives g(x).
     # However, for a general solver, usually we ask for f(x)=0.
     # But FPI specifically needs x = g(x).
     # I will assume the input 'func_str' IS g(x).
-    results = []
+    # With use_aitken=True, every three successive iterates are replaced by the
+    # Aitken delta-squared extrapolation and iteration restarts from there
+    # (Steffensen's method), turning linear convergence into quadratic.
+    results = None
+    if record and use_aitken:
+        results = _new_table("Iteration", "x(i)", "g(x)", "Aitken x*", "Error")
+    elif record:
+        results = _new_table("Iteration", "x(i)", "g(x)", "Error")
+    history = [x0] # Rolling buffer of the last (up to) three iterates
     
     for i in range(1, max_iter + 1):
         x1 = evaluate_function(func_str, x0)
-        error = abs(x1 - x0)
+        gx = x1
         
-        results.append({
-            "Iteration": i,
-            "x(i)": x0,
-            "g(x)": x1,
-            "Error": error
-        })
+        if use_aitken:
+            history.append(x1)
+            if len(history) == 3:
+                x_prev2, x_prev1, _ = history
+                denom = x1 - 2 * x_prev1 + x_prev2
+                if math.fabs(denom) > 1e-14:
+                    x1 = x1 - (x1 - x_prev1) ** 2 / denom
+                    history = [x1]
+                else:
+                    history.pop(0)
+                    
+        error = math.fabs(x1 - x0)
+        
+        if record and use_aitken:
+            _add_row(results, i, x0, gx, x1, error)
+        elif record:
+            _add_row(results, i, x0, gx, error)
         
         if error < tol:
             return {"results": results, "root": x1, "final_error": error, "iterations": i}
@@ -184,27 +285,22 @@ def fixed_point_iteration(func_str, x0, tol, max_iter):
         
     return {"results": results, "root": x1, "final_error": error, "iterations": max_iter}
 
-def modified_secant_method(func_str, x0, delta, tol, max_iter):
-    results = []
+def modified_secant_method(func_str, x0, delta, tol, max_iter, record=True):
+    results = _new_table("Iteration", "x(i)", "x(i+1) (Root Est)", "f(x)", "Error") if record else None
     
     for i in range(1, max_iter + 1):
         f0 = evaluate_function(func_str, x0)
         f_delta = evaluate_function(func_str, x0 + delta * x0)
         
         denom = f_delta - f0
-        if abs(denom) < 1e-12:
+        if denom == 0.0:
              return {"error": "Division by zero in Modified Secant Method."}
 
         x1 = x0 - (delta * x0 * f0) / denom
-        error = abs(x1 - x0)
+        error = math.fabs(x1 - x0)
         
-        results.append({
-            "Iteration": i,
-            "x(i)": x0,
-            "x(i+1) (Root Est)": x1,
-            "f(x)": f0,
-            "Error": error
-        })
+        if record:
+            _add_row(results, i, x0, x1, f0, error)
         
         if error < tol:
              return {"results": results, "root": x1, "final_error": error, "iterations": i}
@@ -214,80 +310,542 @@ def modified_secant_method(func_str, x0, delta, tol, max_iter):
     return {"results": results, "root": x1, "final_error": error, "iterations": max_iter}
 
 
+# --- Polynomial Reference Roots ---
+
+# np.roots solves an n x n eigenproblem, so high-degree inputs get no reference root
+MAX_REFERENCE_DEGREE = 50
+
+@functools.lru_cache(maxsize=128)
+def polynomial_roots(func_str):
+    """Returns all (complex) roots of a polynomial func_str, or None if it isn't one.
+
+    Uses numpy's companion-matrix eigensolver, so no iteration is involved.
+    Also None above MAX_REFERENCE_DEGREE. Cached per function string; the
+    returned array is read-only.
+    """
+    x = sp.symbols('x')
+    expr = _parse(func_str)
+    if x not in expr.free_symbols or not expr.is_polynomial(x):
+        return None
+    if sp.degree(expr, x) > MAX_REFERENCE_DEGREE:
+        return None
+    try:
+        coeffs = [float(c) for c in sp.Poly(expr, x).all_coeffs()]
+    except TypeError: # Symbolic coefficients
+        return None
+    roots = np.roots(coeffs)
+    roots.setflags(write=False)
+    return roots
+
+def reference_root(func_str, near):
+    """Returns the real eigenvalue root closest to near (e.g. the root a solver found).
+
+    This is a floating-point reference, not an exact root. Returns None if
+    func_str isn't a (low-degree) polynomial or has no real roots.
+    """
+    roots = polynomial_roots(func_str)
+    if roots is None:
+        return None
+    real_roots = roots[np.abs(roots.imag) <= 1e-9 * np.maximum(1.0, np.abs(roots))].real
+    if real_roots.size == 0:
+        return None
+    return float(real_roots[np.argmin(np.abs(real_roots - near))])
+
+def add_reference_root(result, func_str):
+    """Adds the reference root nearest the iterative root, and the error against it, if available.
+
+    The error is stored as relative_error, or as absolute_error when the
+    reference root is 0 and a relative error is undefined.
+    """
+    if "error" in result:
+        return result
+    reference = reference_root(func_str, result["root"])
+    if reference is not None:
+        result["reference_root"] = reference
+        if reference != 0:
+            result["relative_error"] = abs(result["root"] - reference) / abs(reference)
+        else:
+            result["absolute_error"] = abs(result["root"])
+    return result
+
+
+# --- Vectorized (Batch) Methods ---
+# These solve many independent problems at once: the inputs are arrays of
+# brackets / initial guesses and each iteration is a handful of numpy array ops.
+# Problems that have already converged are masked out of further evaluations.
+# A problem that fails (no sign change, division by zero, or an overflowed /
+# undefined iterate) is flagged on its own; the rest of the batch still runs,
+# and numpy's overflow / invalid-value warnings are silenced since they're
+# reported through that flag instead.
+
+@functools.lru_cache(maxsize=128)
+def _compile_vec(func_str):
+    """Like _compile, but returns a numpy callable that broadcasts over arrays."""
+    try:
+        x = sp.symbols('x')
+        expr = _parse(func_str)
+        if x not in expr.free_symbols:
+            value = float(expr)
+            return lambda x_val: np.full(np.shape(x_val), value)
+        return sp.lambdify(x, _numeric_form(expr, x), modules='numpy')
+    except Exception as e:
+        raise ValueError(f"Error evaluating function: {e}")
+
+@functools.lru_cache(maxsize=128)
+def _compile_vec_with_derivative(func_str):
+    """Like _compile_with_derivative, but returns a numpy callable that broadcasts over arrays."""
+    try:
+        x = sp.symbols('x')
+        expr = _parse(func_str)
+        diff_expr = sp.diff(expr, x)
+        return sp.lambdify(x, (_numeric_form(expr, x), _numeric_form(diff_expr, x)), modules='numpy', cse=True)
+    except Exception as e:
+        raise ValueError(f"Error evaluating function: {e}")
+
+def _as_batch(*arrays):
+    """Converts the inputs to equally-shaped, writable 1-D float arrays."""
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float)) for v in arrays])
+    return [v.ravel().copy() for v in arrays]
+
+def _batch_result(root, error, iterations, failed):
+    """Packs a batch result. Failed problems get a NaN root and error."""
+    root[failed] = np.nan
+    error[failed] = np.nan
+    return {"root": root, "final_error": error, "iterations": iterations, "failed": failed}
+
+@np.errstate(all='ignore')
+def bisection_vec(func_str, a, b, tol, max_iter):
+    f = _compile_vec(func_str)
+    a, b = _as_batch(a, b)
+    
+    fa = f(a)
+    fb = f(b)
+    
+    # Brackets without a sign change (or where f is undefined) fail on their own
+    failed = ~(fa * fb < 0)
+    c = (a + b) / 2
+    error = np.abs(b - a)
+    iterations = np.zeros(a.shape, dtype=int)
+    active = ~failed
+    
+    for i in range(1, max_iter + 1):
+        if not active.any():
+            break
+        idx = np.flatnonzero(active)
+        ci = (a[idx] + b[idx]) / 2
+        ei = np.abs(b[idx] - a[idx])
+        c[idx] = ci
+        error[idx] = ei
+        iterations[idx] = i
+        
+        # Problems whose interval is already tight are done without evaluating f(c)
+        tight = ei < tol
+        active[idx[tight]] = False
+        idx, ci = idx[~tight], ci[~tight]
+        if idx.size == 0:
+            break
+        fci = f(ci)
+        
+        left = fa[idx] * fci < 0
+        b[idx] = np.where(left, ci, b[idx])
+        fb[idx] = np.where(left, fci, fb[idx])
+        a[idx] = np.where(left, a[idx], ci)
+        fa[idx] = np.where(left, fa[idx], fci)
+        
+        undefined = ~np.isfinite(fci)
+        failed[idx[undefined]] = True
+        active[idx] = ~(np.abs(fci) < tol) & ~undefined
+            
+    return _batch_result(c, error, iterations, failed)
+
+@np.errstate(all='ignore')
+def regula_falsi_vec(func_str, a, b, tol, max_iter):
+    f = _compile_vec(func_str)
+    a, b = _as_batch(a, b)
+    
+    fa = f(a)
+    fb = f(b)
+    
+    # Brackets without a sign change (or where f is undefined) fail on their own
+    failed = ~(fa * fb < 0)
+    c = a.copy()
+    error = np.abs(fa)
+    iterations = np.zeros(a.shape, dtype=int)
+    active = ~failed
+    
+    for i in range(1, max_iter + 1):
+        if not active.any():
+            break
+        idx = np.flatnonzero(active)
+        denom = fb[idx] - fa[idx]
+        zero = denom == 0.0 # Division by zero: only these problems fail
+        failed[idx[zero]] = True
+        active[idx[zero]] = False
+        idx, denom = idx[~zero], denom[~zero]
+            
+        ci = (a[idx] * fb[idx] - b[idx] * fa[idx]) / denom
+        fci = f(ci)
+        ei = np.abs(fci)
+        c[idx] = ci
+        error[idx] = ei
+        iterations[idx] = i
+        
+        left = fa[idx] * fci < 0
+        b[idx] = np.where(left, ci, b[idx])
+        fb[idx] = np.where(left, fci, fb[idx])
+        a[idx] = np.where(left, a[idx], ci)
+        fa[idx] = np.where(left, fa[idx], fci)
+        
+        diverged = ~np.isfinite(ci) | ~np.isfinite(fci)
+        failed[idx[diverged]] = True
+        active[idx] = ~(ei < tol) & ~diverged
+            
+    return _batch_result(c, error, iterations, failed)
+
+@np.errstate(all='ignore')
+def secant_vec(func_str, x0, x1, tol, max_iter):
+    f = _compile_vec(func_str)
+    x0, x1 = _as_batch(x0, x1)
+    
+    f0 = f(x0)
+    f1 = f(x1)
+    root = x1.copy()
+    error = np.abs(x1 - x0)
+    iterations = np.zeros(x0.shape, dtype=int)
+    failed = np.zeros(x0.shape, dtype=bool)
+    active = np.ones(x0.shape, dtype=bool)
+    
+    for i in range(1, max_iter + 1):
+        if not active.any():
+            break
+        idx = np.flatnonzero(active)
+        denom = f1[idx] - f0[idx]
+        zero = denom == 0.0 # Division by zero: only these problems fail
+        failed[idx[zero]] = True
+        active[idx[zero]] = False
+        idx, denom = idx[~zero], denom[~zero]
+            
+        x2 = x1[idx] - f1[idx] * (x1[idx] - x0[idx]) / denom
+        ei = np.abs(x2 - x1[idx])
+        root[idx] = x2
+        error[idx] = ei
+        iterations[idx] = i
+        
+        x0[idx], f0[idx] = x1[idx], f1[idx]
+        x1[idx], f1[idx] = x2, f(x2)
+        
+        diverged = ~np.isfinite(ei)
+        failed[idx[diverged]] = True
+        active[idx] = ~(ei < tol) & ~diverged
+            
+    return _batch_result(root, error, iterations, failed)
+
+@np.errstate(all='ignore')
+def newton_vec(func_str, x0, tol, max_iter):
+    fdf = _compile_vec_with_derivative(func_str)
+    x0, = _as_batch(x0)
+    
+    root = x0.copy()
+    error = np.full(x0.shape, np.inf)
+    iterations = np.zeros(x0.shape, dtype=int)
+    failed = np.zeros(x0.shape, dtype=bool)
+    active = np.ones(x0.shape, dtype=bool)
+    
+    for i in range(1, max_iter + 1):
+        if not active.any():
+            break
+        idx = np.flatnonzero(active)
+        xi = x0[idx]
+        # Constant parts of f or f' come back as scalars
+        f0, df0 = np.broadcast_arrays(*fdf(xi), xi)[:2]
+        
+        zero = np.abs(df0) < 1e-12 # Derivative is zero: only these problems fail
+        failed[idx[zero]] = True
+        active[idx[zero]] = False
+        idx, xi, f0, df0 = idx[~zero], xi[~zero], f0[~zero], df0[~zero]
+            
+        x1 = xi - f0 / df0
+        ei = np.abs(x1 - xi)
+        root[idx] = x1
+        error[idx] = ei
+        iterations[idx] = i
+        x0[idx] = x1
+        
+        diverged = ~np.isfinite(ei)
+        failed[idx[diverged]] = True
+        active[idx] = ~(ei < tol) & ~diverged
+            
+    return _batch_result(root, error, iterations, failed)
+
+
+# --- Generated Solvers ---
+# A solver generated for one specific f runs its whole iteration without going
+# back through evaluate_function: generate_solver emits Python source with f
+# inlined into the loop; run_method uses it when no table is recorded.
+
+# Source templates for generate_solver. {f} (and {df}) are replaced with the
+# function's Python source in terms of x, so each evaluation is inlined as
+# "x = ...; fx = <expression>" instead of a call. In Newton, {shared} holds the
+# subexpressions common to f and f', computed once per iteration. The loops
+# mirror the record=False paths of the methods above and return the same
+# result/error dicts.
+_SOLVER_TEMPLATES = {
+    "bisection": """
+def solver(a, b, tol, max_iter):
+    x = a
+    fa = {f}
+    x = b
+    fb = {f}
+    if fa * fb >= 0:
+        return failure("Bisection method fails: f(a) and f(b) must have opposite signs.")
+    c = (a + b) / 2
+    error = fabs(b - a)
+    for i in range(1, max_iter + 1):
+        c = (a + b) / 2
+        error = fabs(b - a)
+        if error < tol:
+            return result(c, error, i)
+        x = c
+        fc = {f}
+        if fabs(fc) < tol:
+            return result(c, error, i)
+        if fa * fc < 0:
+            b = c
+        else:
+            a = c
+            fa = fc
+    return result(c, error, max_iter)
+""",
+    "regula_falsi": """
+def solver(a, b, tol, max_iter):
+    x = a
+    fa = {f}
+    x = b
+    fb = {f}
+    if fa * fb >= 0:
+        return failure("Regula Falsi method fails: f(a) and f(b) must have opposite signs.")
+    c = a
+    error = fabs(fa)
+    for i in range(1, max_iter + 1):
+        denom = fb - fa
+        if denom == 0.0:
+            return failure("Division by zero in Regula Falsi.")
+        c = (a * fb - b * fa) / denom
+        x = c
+        fc = {f}
+        error = fabs(fc)
+        if error < tol:
+            return result(c, error, i)
+        if fa * fc < 0:
+            b = c
+            fb = fc
+        else:
+            a = c
+            fa = fc
+    return result(c, error, max_iter)
+""",
+    "secant": """
+def solver(x0, x1, tol, max_iter):
+    x = x0
+    f0 = {f}
+    x = x1
+    f1 = {f}
+    x2 = x1
+    error = fabs(x1 - x0)
+    for i in range(1, max_iter + 1):
+        denom = f1 - f0
+        if denom == 0.0:
+            return failure("Division by zero in Secant Method.")
+        x2 = x1 - f1 * (x1 - x0) / denom
+        error = fabs(x2 - x1)
+        if error < tol:
+            return result(x2, error, i)
+        x = x2
+        x0, f0 = x1, f1
+        x1, f1 = x2, {f}
+    return result(x2, error, max_iter)
+""",
+    "newton": """
+def solver(x0, tol, max_iter):
+    x1 = x0
+    error = math.inf
+    for i in range(1, max_iter + 1):
+        x = x0
+        {shared}
+        f0 = {f}
+        df0 = {df}
+        if fabs(df0) < 1e-12:
+            return failure("Derivative is zero. Newton-Raphson fails.")
+        x1 = x0 - f0 / df0
+        error = fabs(x1 - x0)
+        if error < tol:
+            return result(x1, error, i)
+        x0 = x1
+    return result(x1, error, max_iter)
+""",
+}
+
+@functools.lru_cache(maxsize=128)
+def generate_solver(method, func_str):
+    """Generates and compiles a solver specialized to func_str at runtime.
+
+    Supports bisection, regula_falsi, secant and newton. The returned solver
+    takes the method's inputs plus tol and max_iter and returns the same dict
+    as the method with record=False. Raises ValueError if func_str can't be
+    turned into Python source.
+    """
+    if method not in _SOLVER_TEMPLATES:
+        raise ValueError(f"No generated solver for method: {method}")
+    x = sp.symbols('x')
+    try:
+        expr = _parse(func_str)
+        if method == "newton":
+            # Only Newton needs f', and only its template has a {shared} slot
+            shared, (f_expr, df_expr) = sp.cse(
+                [_numeric_form(expr, x), _numeric_form(sp.diff(expr, x), x)],
+                symbols=sp.numbered_symbols('_cse'))
+            shared_src = "\n        ".join(f"{sym} = {sp.pycode(value)}" for sym, value in shared)
+            src = _SOLVER_TEMPLATES[method].format(
+                f=sp.pycode(f_expr), df=sp.pycode(df_expr), shared=shared_src)
+        else:
+            src = _SOLVER_TEMPLATES[method].format(f=sp.pycode(_numeric_form(expr, x)))
+        namespace = {
+            "math": math,
+            "fabs": math.fabs,
+            "result": lambda root, error, iterations: {
+                "results": None, "root": root, "final_error": error, "iterations": iterations},
+            "failure": lambda message: {"error": message},
+        }
+        exec(compile(src, f"<{method} solver for {func_str}>", "exec"), namespace)
+    except Exception as e:
+        raise ValueError(f"Cannot generate a solver for this function: {e}")
+    return namespace["solver"]
+
+
+# --- Method Tables ---
+# Each method name maps to its solver and the numeric inputs it needs besides
+# the function, tolerance and max iterations. Scalar methods also say whether
+# the result can be compared against the polynomial reference root: not for fixed
+# point, which takes g(x) rather than f(x). Shared by the CLI and the web app.
+
+METHODS = {
+    "bisection": (bisection_method, ["a", "b"], True),
+    "regula_falsi": (regula_falsi_method, ["a", "b"], True),
+    "secant": (secant_method, ["x0", "x1"], True),
+    "newton": (newton_raphson_method, ["x0"], True),
+    "fixed_point": (fixed_point_iteration, ["x0"], False),
+    "modified_secant": (modified_secant_method, ["x0", "delta"], True),
+    "fixed_point_aitken": (functools.partial(fixed_point_iteration, use_aitken=True), ["x0"], False),
+}
+
+BATCH_METHODS = {
+    "bisection": (bisection_vec, ["a", "b"]),
+    "regula_falsi": (regula_falsi_vec, ["a", "b"]),
+    "secant": (secant_vec, ["x0", "x1"]),
+    "newton": (newton_vec, ["x0"]),
+}
+
+def _run_generated(method, func_str, kwargs, tol, max_iter):
+    """Runs the generated solver for method, or returns None if it can't be used.
+
+    Functions that can't be generated, or whose inlined evaluation raises (e.g.
+    a math domain error), are left to the regular solver and its evalf fallback.
+    """
+    try:
+        return generate_solver(method, func_str)(**kwargs, tol=tol, max_iter=max_iter)
+    except Exception:
+        return None
+
+def run_method(method, func_str, inputs, tol, max_iter, record=True):
+    """Runs a method from METHODS, reading its numeric inputs from the inputs mapping."""
+    fn, params, has_reference = METHODS[method]
+    kwargs = {name: float(inputs[name]) for name in params}
+    result = None
+    if not record and method in _SOLVER_TEMPLATES:
+        result = _run_generated(method, func_str, kwargs, tol, max_iter)
+    if result is None:
+        result = fn(func_str, **kwargs, tol=tol, max_iter=max_iter, record=record)
+    
+    if has_reference:
+        add_reference_root(result, func_str)
+    return result
+
+
 # --- CLI Interface ---
 
+MENU = [
+    ("1", "Bisection Method", "bisection"),
+    ("2", "Regula Falsi Method", "regula_falsi"),
+    ("3", "Secant Method", "secant"),
+    ("4", "Newton-Raphson Method", "newton"),
+    ("5", "Fixed Point Iteration", "fixed_point"),
+    ("6", "Modified Secant Method", "modified_secant"),
+    ("7", "Fixed Point (Aitken-accelerated)", "fixed_point_aitken"),
+]
+
+PROMPTS = {
+    "a": "Enter start of interval (a): ",
+    "b": "Enter end of interval (b): ",
+    "x0": "Enter initial guess (x0): ",
+    "x1": "Enter second guess (x1): ",
+    "delta": "Enter perturbation delta (e.g., 0.01): ",
+}
+
 def main():
     print("========================================")
     print("   ZOF Solver - Zero of Functions CLI   ")
     print("========================================")
     
+    choices = {key: method for key, _, method in MENU}
+    
     while True:
         print("\nSelect Method:")
-        print("1. Bisection Method")
-        print("2. Regula Falsi Method")
-        print("3. Secant Method")
-        print("4. Newton-Raphson Method")
-        print("5. Fixed Point Iteration")
-        print("6. Modified Secant Method")
+        for key, label, _ in MENU:
+            print(f"{key}. {label}")
         print("0. Exit")
         
-        choice = input("Enter choice (0-6): ").strip()
+        choice = input(f"Enter choice (0-{len(MENU)}): ").strip()
         
         if choice == '0':
             print("Exiting...")
             break
             
-        if choice not in ['1', '2', '3', '4', '5', '6']:
+        if choice not in choices:
             print("Invalid choice. Please try again.")
             continue
             
         try:
+            method = choices[choice]
             func_str = input("Enter function (e.g., x**2 - 4): ").strip()
             tol = float(input("Enter tolerance (e.g., 1e-6): ").strip())
             max_iter = int(input("Enter max iterations (e.g., 100): ").strip())
+            # Fast mode skips recording (and printing) the iteration table
+            record = input("Show iteration table? (Y/n): ").strip().lower() != 'n'
             
-            result = None
-            
-            if choice == '1': # Bisection
-                a = float(input("Enter start of interval (a): "))
-                b = float(input("Enter end of interval (b): "))
-                result = bisection_method(func_str, a, b, tol, max_iter)
-                
-            elif choice == '2': # Regula Falsi
-                a = float(input("Enter start of interval (a): "))
-                b = float(input("Enter end of interval (b): "))
-                result = regula_falsi_method(func_str, a, b, tol, max_iter)
-                
-            elif choice == '3': # Secant
-                x0 = float(input("Enter first guess (x0): "))
-                x1 = float(input("Enter second guess (x1): "))
-                result = secant_method(func_str, x0, x1, tol, max_iter)
-                
-            elif choice == '4': # Newton-Raphson
-                x0 = float(input("Enter initial guess (x0): "))
-                result = newton_raphson_method(func_str, x0, tol, max_iter)
-                
-            elif choice == '5': # Fixed Point
+            if method.startswith("fixed_point"):
                 print("NOTE: For Fixed Point, enter g(x) such that x = g(x).")
-                x0 = float(input("Enter initial guess (x0): "))
-                result = fixed_point_iteration(func_str, x0, tol, max_iter)
-                
-            elif choice == '6': # Modified Secant
-                x0 = float(input("Enter initial guess (x0): "))
-                delta = float(input("Enter perturbation delta (e.g., 0.01): "))
-                result = modified_secant_method(func_str, x0, delta, tol, max_iter)
+            _, params, _ = METHODS[method]
+            inputs = {name: input(PROMPTS[name]) for name in params}
+            result = run_method(method, func_str, inputs, tol, max_iter, record=record)
             
             # Output
             if "error" in result:
                 print(f"\nERROR: {result['error']}")
             else:
-                print("\n--- Iteration Results ---")
-                df = pd.DataFrame(result['results'])
-                print(df.to_string(index=False))
+                if record:
+                    print("\n--- Iteration Results ---")
+                    df = pd.DataFrame(result['results'])
+                    print(df.to_string(index=False))
                 print("\n--- Final Result ---")
                 print(f"Root: {result['root']}")
                 print(f"Final Error: {result['final_error']}")
                 print(f"Iterations: {result['iterations']}")
+                if "reference_root" in result:
+                    print(f"Reference Root (companion matrix): {result['reference_root']}")
+                    if "relative_error" in result:
+                        print(f"Relative Error: {result['relative_error']}")
+                    else:
+                        print(f"Absolute Error: {result['absolute_error']}")
                 
         except Exception as e:
             print(f"An error occurred: {e}")
@@ -1,9 +1,21 @@
 from flask import Flask, render_template, request, jsonify
 import ZOF_CLI as solver
+import numpy as np
+import os
+import sys
 import traceback
 
 app = Flask(__name__)
 
+# Functions compiled ahead of the first request (the web form's default first)
+WARM_FUNCTIONS = ["x**2 - 4", "x**3 - 2*x - 5", "cos(x) - x", "sqrt(x + 2)"]
+
+def warm_caches():
+    """Parses and lambdifies common functions so first requests skip the compile step."""
+    for func_str in WARM_FUNCTIONS:
+        solver.evaluate_function(func_str, 1.0)
+        solver.evaluate_with_derivative(func_str, 1.0)
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -16,39 +28,13 @@ def solve():
         func_str = data.get('function')
         tol = float(data.get('tolerance'))
         max_iter = int(data.get('max_iter'))
+        # ?trace=0 skips building the iteration table
+        record = request.args.get('trace', '1') != '0'
         
-        result = {}
-        
-        if method == 'bisection':
-            a = float(data.get('a'))
-            b = float(data.get('b'))
-            result = solver.bisection_method(func_str, a, b, tol, max_iter)
-            
-        elif method == 'regula_falsi':
-            a = float(data.get('a'))
-            b = float(data.get('b'))
-            result = solver.regula_falsi_method(func_str, a, b, tol, max_iter)
-            
-        elif method == 'secant':
-            x0 = float(data.get('x0'))
-            x1 = float(data.get('x1'))
-            result = solver.secant_method(func_str, x0, x1, tol, max_iter)
-            
-        elif method == 'newton':
-            x0 = float(data.get('x0'))
-            result = solver.newton_raphson_method(func_str, x0, tol, max_iter)
-            
-        elif method == 'fixed_point':
-            x0 = float(data.get('x0'))
-            result = solver.fixed_point_iteration(func_str, x0, tol, max_iter)
-            
-        elif method == 'modified_secant':
-            x0 = float(data.get('x0'))
-            delta = float(data.get('delta'))
-            result = solver.modified_secant_method(func_str, x0, delta, tol, max_iter)
-            
-        else:
+        if method not in solver.METHODS:
             return jsonify({"error": "Invalid method selected"}), 400
+            
+        result = solver.run_method(method, func_str, data, tol, max_iter, record=record)
 
         if "error" in result:
             return jsonify({"error": result["error"]}), 400
@@ -58,5 +44,44 @@ def solve():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/solve_batch', methods=['POST'])
+def solve_batch():
+    try:
+        data = request.json
+        method = data.get('method')
+        func_str = data.get('function')
+        tol = float(data.get('tolerance'))
+        max_iter = int(data.get('max_iter'))
+        
+        if method not in solver.BATCH_METHODS:
+            return jsonify({"error": "Invalid method selected"}), 400
+            
+        fn, params = solver.BATCH_METHODS[method]
+        inputs = {}
+        for name in params:
+            try:
+                values = np.asarray(data.get(name), dtype=float)
+            except (TypeError, ValueError):
+                values = None
+            # A missing field would otherwise become NaN and come back as a 200
+            if values is None or values.size == 0 or not np.isfinite(values).all():
+                return jsonify({"error": f"Missing or non-finite input: {name}"}), 400
+            inputs[name] = values
+        try:
+            np.broadcast_shapes(*(values.shape for values in inputs.values()))
+        except ValueError:
+            return jsonify({"error": "Batch inputs must have matching lengths"}), 400
+        result = fn(func_str, **inputs, tol=tol, max_iter=max_iter)
+
+        # Failed problems carry NaN, which is not valid JSON; send null instead
+        return jsonify({key: [v if not isinstance(v, float) or np.isfinite(v) else None for v in value.tolist()]
+                        for key, value in result.items()})
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Local development server only; production runs under gunicorn (see gunicorn.conf.py).
+    # The debugger and reloader are opt-in: python app.py --dev, or FLASK_DEBUG=1
+    debug = '--dev' in sys.argv or os.environ.get('FLASK_DEBUG') == '1'
+    app.run(debug=debug)
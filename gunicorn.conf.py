@@ -0,0 +1,25 @@
+# Gunicorn settings, picked up automatically by: gunicorn app:app
+#
+# Each /solve request is independent, CPU-bound Python, so requests run in
+# parallel across worker processes: one per usable core, capped at 4 since
+# every worker holds its own sympy/numpy caches. Set WEB_CONCURRENCY to
+# override the worker count, e.g. to go past the cap on a large dedicated host.
+# The bind address follows gunicorn's defaults (0.0.0.0:$PORT when PORT is set).
+import os
+
+MAX_DEFAULT_WORKERS = 4
+
+def _usable_cores():
+    # cpu_count() reports every host core inside a container; the affinity
+    # mask reflects what this process may actually run on
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        return os.cpu_count() or 1
+
+workers = int(os.environ.get("WEB_CONCURRENCY", min(_usable_cores(), MAX_DEFAULT_WORKERS)))
+
+def post_worker_init(worker):
+    # Every worker has its own parse/lambdify caches; fill them before serving
+    from app import warm_caches
+    warm_caches()
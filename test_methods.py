@@ -1,5 +1,6 @@
 import ZOF_CLI as solver
 import math
+import warnings
 
 def test_methods():
     print("Running Tests...")
@@ -10,22 +11,27 @@ def test_methods():
     print("\n--- Bisection ---")
     res = solver.bisection_method(func, 0, 3, 1e-5, 100)
     print(f"Root: {res.get('root')}, Error: {res.get('final_error')}")
+    assert abs(res["root"] - 2) < 1e-5
     
     print("\n--- Regula Falsi ---")
     res = solver.regula_falsi_method(func, 0, 3, 1e-5, 100)
     print(f"Root: {res.get('root')}, Error: {res.get('final_error')}")
+    assert abs(res["root"] - 2) < 1e-5
     
     print("\n--- Secant ---")
     res = solver.secant_method(func, 0, 3, 1e-5, 100)
     print(f"Root: {res.get('root')}, Error: {res.get('final_error')}")
+    assert abs(res["root"] - 2) < 1e-5
     
     print("\n--- Newton-Raphson ---")
     res = solver.newton_raphson_method(func, 1, 1e-5, 100)
     print(f"Root: {res.get('root')}, Error: {res.get('final_error')}")
+    assert abs(res["root"] - 2) < 1e-5
     
     print("\n--- Modified Secant ---")
     res = solver.modified_secant_method(func, 1, 0.01, 1e-5, 100)
     print(f"Root: {res.get('root')}, Error: {res.get('final_error')}")
+    assert abs(res["root"] - 2) < 1e-5
 
     # Fixed Point: x = g(x) -> x = sqrt(4) -> g(x) = 4/x ? No, x^2=4 -> x = 4/x is unstable.
     # Try g(x) = 2 + 0.5*(x - 2) ? 
@@ -33,6 +39,162 @@ def test_methods():
     print("\n--- Fixed Point (x = sqrt(x+2), Root=2) ---")
     res = solver.fixed_point_iteration("sqrt(x+2)", 1, 1e-5, 100)
     print(f"Root: {res.get('root')}, Error: {res.get('final_error')}")
+    assert abs(res["root"] - 2) < 1e-5
+    
+    print("\n--- Fixed Point, Aitken-accelerated (x = sqrt(x+2), Root=2) ---")
+    plain = res
+    res = solver.fixed_point_iteration("sqrt(x+2)", 1, 1e-5, 100, use_aitken=True)
+    print(f"Root: {res.get('root')}, Error: {res.get('final_error')}, Iterations: {res.get('iterations')}")
+    assert abs(res["root"] - 2) < 1e-5
+    assert res["iterations"] < plain["iterations"]
+
+    # Batch: the same problem from several brackets at once, roots = 2, 2, -2
+    print("\n--- Bisection (vectorized) ---")
+    res = solver.bisection_vec(func, [0, 1, -3], [3, 2.5, -1], 1e-5, 100)
+    print(f"Roots: {res.get('root')}, Errors: {res.get('final_error')}")
+    assert all(abs(r - e) < 1e-5 for r, e in zip(res["root"], [2, 2, -2]))
+    
+    for res in (solver.regula_falsi_vec(func, [0, 1, -3], [3, 2.5, -1], 1e-5, 100),
+                solver.secant_vec(func, [0, 1, -3], [3, 2.5, -1], 1e-5, 100),
+                solver.newton_vec(func, [1, 2.5, -3], 1e-5, 100)):
+        assert not res["failed"].any()
+        assert all(abs(r - e) < 1e-5 for r, e in zip(res["root"], [2, 2, -2]))
+
+def test_order_aware_early_exit():
+    # conservative=False stops one step earlier, still within tol of the root,
+    # and reports the order-based error estimate instead of the last step
+    tol = 1e-10
+    for method, args in [(solver.newton_raphson_method, (1,)), (solver.secant_method, (0, 3))]:
+        full = method("x**2 - 4", *args, tol, 100)
+        early = method("x**2 - 4", *args, tol, 100, conservative=False)
+        assert early["iterations"] == full["iterations"] - 1
+        assert abs(early["root"] - 2) < tol
+        assert early["final_error"] < tol
+
+def test_unprintable_functions_raise_value_error():
+    # f' of Abs(x) can't be lambdified; Newton must still fail with a ValueError
+    for run in (lambda: solver.newton_raphson_method("Abs(x) - 1", 1.5, 1e-6, 50),
+                lambda: solver.newton_vec("Abs(x) - 1", [1.5], 1e-6, 50)):
+        try:
+            run()
+        except ValueError:
+            continue
+        raise AssertionError("expected ValueError")
+    # besselj isn't in the math module, so f is evaluated through the sympy fallback
+    res = solver.modified_secant_method("besselj(0, x)", 2, 0.01, 1e-10, 50)
+    assert abs(res["root"] - 2.404825557695773) < 1e-9
+
+def test_generated_solvers():
+    # f = x*exp(x) - exp(x) - 1 shares exp(x) with f'; root ~ 1.2785
+    func = "x*exp(x) - exp(x) - 1"
+    expected = solver.newton_raphson_method(func, 1, 1e-12, 100)["root"]
+    runs = {
+        "bisection": (0.1, 3),
+        "regula_falsi": (0.1, 3),
+        "secant": (1, 2),
+        "newton": (1,),
+    }
+    for method, inputs in runs.items():
+        res = solver.generate_solver(method, func)(*inputs, 1e-10, 200)
+        assert abs(res["root"] - expected) < 1e-6, method
+    # gamma's derivative (polygamma) isn't printable, but bisection doesn't need it
+    res = solver.generate_solver("bisection", "gamma(x) - 2")(2.5, 4, 1e-10, 200)
+    assert abs(solver.evaluate_function("gamma(x)", res["root"]) - 2) < 1e-6
+
+def test_run_method_without_table():
+    # record=False goes through the generated solvers and must match the traced run
+    inputs = {"a": 0.5, "b": 2.5, "x0": 1, "x1": 2.5, "delta": 0.01}
+    for func in ["x**2 - 4", "x*sin(x) - 1", "sqrt(x + 2) - 2"]:
+        for method in solver.METHODS:
+            if method.startswith("fixed_point"):
+                continue
+            fast = solver.run_method(method, func, inputs, 1e-8, 100, record=False)
+            full = solver.run_method(method, func, inputs, 1e-8, 100)
+            assert fast["results"] is None
+            assert fast["root"] == full["root"], (method, func)
+            assert fast["iterations"] == full["iterations"], (method, func)
+    for method in ("fixed_point", "fixed_point_aitken"):
+        fast = solver.run_method(method, "sqrt(x + 2)", {"x0": 1}, 1e-8, 100, record=False)
+        assert fast["results"] is None and abs(fast["root"] - 2) < 1e-7
+    # Failures come back as the same error dicts
+    res = solver.run_method("bisection", "x**2 - 4", {"a": 3, "b": 4}, 1e-8, 100, record=False)
+    assert "opposite signs" in res["error"]
+    res = solver.run_method("newton", "7", {"x0": 1}, 1e-8, 100, record=False)
+    assert res["error"] == "Derivative is zero. Newton-Raphson fails."
+    # Functions that can't be inlined (besselj) use the regular solver
+    res = solver.run_method("newton", "besselj(0, x)", {"x0": 2}, 1e-10, 100, record=False)
+    assert abs(res["root"] - 2.404825557695773) < 1e-9
+
+def test_horner_form():
+    x = solver.sp.symbols('x')
+    # Dense, low-degree polynomials are nested; sparse or high-degree ones are left alone
+    assert solver._numeric_form(solver.sp.sympify("x**3 - 2*x - 5"), x) == x*(x**2 - 2) - 5
+    for func in ["x**20000 - 1", "(x + 1)**60"]:
+        expr = solver.sp.sympify(func)
+        assert solver._numeric_form(expr, x) == expr
+    assert solver.evaluate_function("x**200000 - 1", 1.0) == 0.0
+
+def test_reference_root():
+    # The bracket [-2, 2.5] holds -1, 0 and 1; bisection finds 1, so compare against 1
+    res = solver.run_method("bisection", "x**3 - x", {"a": -2, "b": 2.5}, 1e-8, 100)
+    assert abs(res["root"] - 1) < 1e-7
+    assert abs(res["reference_root"] - 1) < 1e-12
+    assert res["relative_error"] < 1e-7
+    # Reference root 0: relative error is undefined, so the absolute error is reported
+    res = solver.run_method("newton", "x**3 - x", {"x0": 0.1}, 1e-10, 100)
+    assert res["reference_root"] == 0 and "relative_error" not in res
+    assert res["absolute_error"] < 1e-10
+    # Not a polynomial, or fixed point's g(x): no reference root
+    assert "reference_root" not in solver.run_method("newton", "cos(x) - x", {"x0": 1}, 1e-8, 100)
+    assert "reference_root" not in solver.run_method("fixed_point", "sqrt(x+2)", {"x0": 1}, 1e-8, 100)
+    # High degree: no eigensolve, so the request stays as cheap as the iteration itself
+    assert solver.polynomial_roots("x**3000 - 2") is None
+    res = solver.run_method("bisection", "x**3000 - 2", {"a": 0, "b": 2}, 1e-8, 100, record=False)
+    assert "reference_root" not in res and abs(res["root"] ** 3000 - 2) < 1e-3
+
+def test_batch_failures_are_per_problem():
+    # x0 = 0 has a zero derivative; only that problem fails
+    res = solver.newton_vec("x**2 - 4", [1, 5, -3, 0], 1e-8, 100)
+    assert res["failed"].tolist() == [False, False, False, True]
+    assert math.isnan(res["root"][3])
+    assert all(abs(r - e) < 1e-8 for r, e in zip(res["root"][:3], [2, 2, -2]))
+    # [3, 4] has no sign change
+    res = solver.bisection_vec("x**2 - 4", [0, 3], [3, 4], 1e-6, 100)
+    assert res["failed"].tolist() == [False, True]
+    assert abs(res["root"][0] - 2) < 1e-6
+    # f(x0) == f(x1) divides by zero in the first secant step
+    res = solver.secant_vec("x**2 - 4", [0, 1], [3, -1], 1e-8, 100)
+    assert res["failed"].tolist() == [False, True]
+    assert abs(res["root"][0] - 2) < 1e-8
+    # Iterates that overflow fail too, without leaking numpy warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        res = solver.secant_vec("x**2 - 4", [0, 1e308], [3, -1e308], 1e-8, 100)
+        assert res["failed"].tolist() == [False, True]
+        res = solver.newton_vec("exp(x) - 1", [1, 800], 1e-8, 100)
+        assert res["failed"].tolist() == [False, True]
+        res = solver.bisection_vec("log(x)", [0.5, -1], [3, 2], 1e-8, 100)
+        assert res["failed"].tolist() == [False, True]
+
+def test_solve_batch_rejects_bad_inputs():
+    import app
+    client = app.app.test_client()
+    data = {"method": "newton", "function": "x**2 - 4", "tolerance": 1e-8, "max_iter": 100}
+    assert client.post('/solve_batch', json=data).status_code == 400
+    assert client.post('/solve_batch', json={**data, "x0": [1, "nan"]}).status_code == 400
+    res = client.post('/solve_batch', json={**data, "method": "bisection", "a": [0, 1, 2], "b": [3, 3]})
+    assert res.status_code == 400
+    res = client.post('/solve_batch', json={**data, "x0": [1, 0]})
+    assert res.status_code == 200
+    assert res.get_json()["root"][1] is None and res.get_json()["failed"] == [False, True]
 
 if __name__ == "__main__":
     test_methods()
+    test_order_aware_early_exit()
+    test_unprintable_functions_raise_value_error()
+    test_generated_solvers()
+    test_run_method_without_table()
+    test_horner_form()
+    test_reference_root()
+    test_batch_failures_are_per_problem()
+    test_solve_batch_rejects_bad_inputs()